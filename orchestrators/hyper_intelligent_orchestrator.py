@@ -13,54 +13,68 @@ Intelligence Level: MAXIMUM ELEVATION MODE 🧠⚡
 """
 
 import asyncio
-import json
+import contextlib
+import copy
+import hashlib
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from decimal import Decimal
+from functools import cached_property
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Awaitable, Callable, Sequence, Tuple
 from pathlib import Path
 import logging
+import string
+import textwrap
+import time
+import uuid
+
+import msgpack
+import orjson
+import zstandard
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    import httpx
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-class GitHubEnhancedConnector:
-    """Enhanced GitHub integration with intelligence"""
-    
-    def __init__(self, token: str):
-        self.token = token
-        self.api_base = "https://api.github.com"
-        self.intelligence_cache = {}
-    
-    async def analyze_repository_intelligence(self, repo_url: str) -> Dict[str, Any]:
-        """Analyze repository for intelligent enhancement opportunities"""
-        
-        analysis = {
-            'repository_url': repo_url,
-            'analysis_timestamp': datetime.utcnow().isoformat(),
-            'intelligence_opportunities': [],
-            'enhancement_recommendations': [],
-            'automation_potential': {},
-            'compliance_gaps': [],
-            'security_improvements': []
-        }
-        
-        # Repository structure analysis
-        structure_analysis = await self.analyze_repo_structure(repo_url)
-        analysis['structure_intelligence'] = structure_analysis
-        
-        # Identify enhancement opportunities
-        opportunities = await self.identify_enhancement_opportunities(structure_analysis)
-        analysis['intelligence_opportunities'] = opportunities
-        
-        # Generate MCP server recommendations
-        mcp_recommendations = await self.generate_mcp_server_recommendations(analysis)
-        analysis['mcp_server_suggestions'] = mcp_recommendations
-        
-        return analysis
-    
-    async def generate_custom_workflow(self, analysis: Dict[str, Any]) -> str:
-        """Generate custom GitHub Actions workflow based on analysis"""
-        
-        workflow_template = f"""
+# Analysis results are reused for this long before being recomputed
+ANALYSIS_CACHE_TTL_SECONDS = 300
+ANALYSIS_CACHE_MAX_ENTRIES = 512
+
+# Upper bound on in-flight AI provider calls and on the whole fan-out
+MAX_CONCURRENT_AI_REQUESTS = 4
+AI_ANALYSIS_TIMEOUT_SECONDS = 30
+
+# Connection pool shared by every request a connector makes
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Notion allows an average of three requests per second per integration
+NOTION_API_VERSION = '2022-06-28'
+NOTION_REQUESTS_PER_SECOND = 3
+
+# Provenance records are written in batches of up to this many records, or
+# whatever has queued within the flush interval, whichever comes first
+PROVENANCE_BATCH_SIZE = 256
+PROVENANCE_FLUSH_INTERVAL_SECONDS = 0.02
+PROVENANCE_QUEUE_MAX_RECORDS = 4096
+
+# zstd level for blockchain payloads; low levels keep encoding off the critical path
+PAYLOAD_COMPRESSION_LEVEL = 3
+
+# Shared pool for CPU-bound provenance work (content hashing, payload encoding)
+# so it runs beside the event loop instead of blocking it
+_CPU_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='provenance-cpu')
+
+# GitHub Actions workflow emitted by GitHubEnhancedConnector; it does not vary
+# with the analysis, so it is built once at import time.
+_WORKFLOW_TEMPLATE = """
 name: FILEBOSS Ultra-Intelligence Pipeline
 
 on:
@@ -89,8 +103,8 @@ jobs:
           
       - name: Run AI-Powered Code Analysis
         env:
-          OPENAI_API_KEY: ${{{{ secrets.OPENAI_API_KEY }}}}
-          ANTHROPIC_API_KEY: ${{{{ secrets.ANTHROPIC_API_KEY }}}}
+          OPENAI_API_KEY: ${{ secrets.OPENAI_API_KEY }}
+          ANTHROPIC_API_KEY: ${{ secrets.ANTHROPIC_API_KEY }}
         run: |
           python orchestrators/hyper_intelligent_orchestrator.py --mode=analysis
           
@@ -107,14 +121,359 @@ jobs:
         run: |
           python deployment/hyper_deploy.py --mode=intelligence-update
 """
+
+# (epoch second, formatted prefix) for the most recent _iso_now() call
+_ISO_SECOND_PREFIX = (-1, '')
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string with microseconds.
+
+    The date/time prefix is only re-formatted when the second changes, so
+    bursts of provenance records avoid building a datetime for every call.
+    """
+    global _ISO_SECOND_PREFIX
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _ISO_SECOND_PREFIX
+    if seconds != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _ISO_SECOND_PREFIX = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+# Source skeleton for servers emitted by DynamicScaffoldGenerator.generate_mcp_server.
+# Parsed once at import; literal fields are substituted as Python reprs and
+# docstring fields are escaped by _docstring_text, so any spec value yields
+# valid source.
+_MCP_SERVER_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""
+$title
+Generated: $generated_at
+Purpose: $purpose
+"""
+
+import asyncio
+from datetime import datetime
+
+import orjson
+from mcp.server.models import InitializationOptions
+from mcp.server import NotificationOptions, Server
+from mcp.types import Resource, Tool, TextContent, ImageContent, EmbeddedResource
+from typing import Any, Awaitable, Callable, Sequence
+
+server = Server($server_name)
+
+@server.list_resources()
+async def handle_list_resources() -> list[Resource]:
+    """List available resources"""
+    return [
+        Resource(
+            uri=$resource_uri,
+            name=$resource_name,
+            description=$resource_description,
+            mimeType="application/json"
+        )
+    ]
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools"""
+    return [
+        Tool(
+            name=$tool_name,
+            description=$tool_description,
+            inputSchema={
+                "type": "object",
+                "properties": $tool_properties,
+                "required": $required_properties
+            }
+        )
+    ]
+
+@server.call_tool()
+async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Handle tool execution with enhanced intelligence"""
+    
+    handler = _TOOL_DISPATCH.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    
+    # Enhanced tool execution logic
+    result = await handler(arguments)
+    
+    return [
+        TextContent(
+            type="text",
+            text=orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        )
+    ]
+
+async def execute_intelligent_tool_logic(arguments: dict) -> dict:
+    """Execute custom tool logic with AI enhancement"""
+    
+    # Custom logic based on specification
+$custom_logic
+    
+    return {
+        'status': 'success',
+        'result': 'Custom tool execution completed',
+        'timestamp': datetime.utcnow().isoformat(),
+        'intelligence_applied': True
+    }
+
+# Tool name -> handler, resolved with a single dict lookup per call
+_TOOL_DISPATCH: dict[str, Callable[[dict], Awaitable[dict]]] = {
+    $tool_name: execute_intelligent_tool_logic,
+}
+
+async def main():
+    # Import server implementation
+    from mcp.server.stdio import stdio_server
+    
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(
+            read_stream,
+            write_stream,
+            InitializationOptions(
+                server_name=$server_name,
+                server_version="1.0.0",
+                capabilities=server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={}
+                )
+            )
+        )
+
+if __name__ == '__main__':
+    asyncio.run(main())
+''')
+
+def _docstring_text(value: Any) -> str:
+    """Text that can be placed inside a triple-quoted docstring verbatim"""
+    return str(value).replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+
+def _http_client(base_url: str, headers: Dict[str, str]) -> 'httpx.AsyncClient':
+    """Pooled HTTP client for a connector.
+
+    httpx dominates this module's import time, so it is only imported once a
+    connector is actually built (via the orchestrator's lazy subsystems).
+    """
+    import httpx
+    
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+
+async def _run_cpu_bound(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a CPU-bound callable on the shared executor"""
+    return await asyncio.get_running_loop().run_in_executor(_CPU_EXECUTOR, func, *args)
+
+# Non-string keys are deliberately not allowed: orjson would encode 1 and '1'
+# identically, so such values have no canonical encoding
+_CANONICAL_JSON_OPTIONS = orjson.OPT_SORT_KEYS
+
+def _type_tag(value: Any) -> str:
+    value_type = type(value)
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
+def _canonical_default(value: Any) -> Any:
+    """Type-tagged JSON form for the non-native values with a canonical encoding.
+
+    Each form carries the value's type, so it never matches a plain string or
+    list. Anything else, including arbitrary objects whose ``repr`` embeds a
+    memory address, raises TypeError.
+    """
+    if isinstance(value, (set, frozenset)):
+        return {'__type__': _type_tag(value), 'value': sorted(value, key=_canonical_encoding)}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {'__type__': _type_tag(value), 'value': bytes(value).hex()}
+    if isinstance(value, os.PathLike):
+        return {'__type__': _type_tag(value), 'value': os.fspath(value)}
+    if isinstance(value, Decimal):
+        return {'__type__': _type_tag(value), 'value': str(value)}
+    raise TypeError(f"No canonical encoding for {type(value).__name__}")
+
+def _canonical_encoding(value: Any) -> bytes:
+    """Process-independent encoding of a value; raises TypeError if it has none"""
+    return orjson.dumps(value, default=_canonical_default, option=_CANONICAL_JSON_OPTIONS)
+
+def _content_digest(value: Any) -> Optional[str]:
+    """Digest of a value that is stable across processes and runs.
+
+    Returns None for values without a canonical encoding (arbitrary objects,
+    cyclic structures, non-string keys), so callers can fall back explicitly.
+    """
+    try:
+        canonical = _canonical_encoding(value)
+    except (TypeError, RecursionError):
+        return None
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+_SUMMARY_FIELDS = itemgetter('user_id', 'user_action', 'compliance_status')
+
+def _summarize_provenance(provenance_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """User, action and compliance aggregates for provenance records in one pass"""
+    users = set()
+    actions = Counter()
+    compliant = 0
+    for user_id, action, compliance_status in map(_SUMMARY_FIELDS, provenance_data):
+        users.add(user_id)
+        actions[action] += 1
+        if compliance_status == 'Compliant':
+            compliant += 1
+    
+    total = len(provenance_data)
+    return {
+        'unique_users': len(users),
+        'action_types': dict(actions),
+        'compliance_score': round(100.0 * compliant / total, 2) if total else 100.0
+    }
+
+def _artifact_id(artifact: Any) -> str:
+    """Artifact's own ``id`` if it has one, otherwise a digest of its content.
+
+    Artifacts without a canonical encoding get a random id rather than one
+    that could collide with an unrelated artifact.
+    """
+    artifact_id = getattr(artifact, 'id', None)
+    if artifact_id is not None:
+        return artifact_id
+    return _content_digest(artifact) or uuid.uuid4().hex
+
+# Notion database schemas for case workspaces; shared read-only by every workspace
+_CASE_MANAGEMENT_PROPERTIES = {
+    'Evidence Item': {'type': 'title'},
+    'Document Type': {
+        'type': 'select',
+        'options': (
+            'Court Filing', 'Email Evidence', 'Financial Record',
+            'Medical Record', 'Communication Log', 'Photo Evidence',
+            'Audio Recording', 'Video Evidence', 'Legal Research'
+        )
+    },
+    'Priority Level': {
+        'type': 'select',
+        'options': ('Critical', 'High', 'Medium', 'Low')
+    },
+    'Analysis Status': {
+        'type': 'select',
+        'options': ('Pending', 'In Progress', 'AI Analyzed', 'Human Reviewed', 'Complete')
+    },
+    'Legal Relevance Score': {'type': 'number'},
+    'Date Received': {'type': 'date'},
+    'Deadline': {'type': 'date'},
+    'Assigned To': {'type': 'people'},
+    'AI Analysis Summary': {'type': 'rich_text'},
+    'Strategic Value': {'type': 'number'},
+    'Compliance Status': {
+        'type': 'select',
+        'options': ('Compliant', 'Needs Review', 'Non-Compliant', 'Pending')
+    },
+    'Tags': {'type': 'multi_select'}
+}
+
+_TIMELINE_PROPERTIES = {
+    'Event': {'type': 'title'},
+    'Date': {'type': 'date'},
+    'Event Type': {
+        'type': 'select',
+        'options': (
+            'Court Hearing', 'Filing Deadline', 'Discovery Event',
+            'Communication', 'Evidence Collection', 'Legal Research',
+            'Strategic Decision', 'Compliance Check'
+        )
+    },
+    'Impact Level': {
+        'type': 'select',
+        'options': ('Critical', 'High', 'Medium', 'Low')
+    },
+    'Status': {
+        'type': 'select',
+        'options': ('Upcoming', 'In Progress', 'Completed', 'Missed')
+    },
+    'Related Evidence': {'type': 'relation'},
+    'AI Analysis': {'type': 'rich_text'},
+    'Action Items': {'type': 'rich_text'},
+    'Responsible Party': {'type': 'people'}
+}
+
+class GitHubEnhancedConnector:
+    """Enhanced GitHub integration with intelligence"""
+    
+    def __init__(self, token: str):
+        self.token = token
+        self.api_base = "https://api.github.com"
+        self._client = _http_client(self.api_base, {
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/vnd.github+json'
+        })
+        self.intelligence_cache = TTLCache(
+            maxsize=ANALYSIS_CACHE_MAX_ENTRIES, ttl=ANALYSIS_CACHE_TTL_SECONDS
+        )
+    
+    async def analyze_repository_intelligence(self, repo_url: str) -> Dict[str, Any]:
+        """Analyze repository for intelligent enhancement opportunities"""
         
-        return workflow_template
+        # Cached analyses are copied in and out so callers that mutate their
+        # result cannot corrupt the entry for the rest of its TTL
+        cached_analysis = self.intelligence_cache.get(repo_url)
+        if cached_analysis is not None:
+            return copy.deepcopy(cached_analysis)
+        
+        analysis = {
+            'repository_url': repo_url,
+            'analysis_timestamp': _iso_now(),
+            'intelligence_opportunities': [],
+            'enhancement_recommendations': [],
+            'automation_potential': {},
+            'compliance_gaps': [],
+            'security_improvements': []
+        }
+        
+        # Repository structure analysis
+        structure_analysis = await self.analyze_repo_structure(repo_url)
+        analysis['structure_intelligence'] = structure_analysis
+        
+        # Identify enhancement opportunities
+        opportunities = await self.identify_enhancement_opportunities(structure_analysis)
+        analysis['intelligence_opportunities'] = opportunities
+        
+        # Generate MCP server recommendations
+        mcp_recommendations = await self.generate_mcp_server_recommendations(analysis)
+        analysis['mcp_server_suggestions'] = mcp_recommendations
+        
+        self.intelligence_cache[repo_url] = copy.deepcopy(analysis)
+        return analysis
+    
+    async def generate_custom_workflow(self, analysis: Dict[str, Any]) -> str:
+        """Generate custom GitHub Actions workflow based on analysis"""
+        
+        return _WORKFLOW_TEMPLATE
+    
+    async def request(self, method: str, path: str, **kwargs: Any) -> 'httpx.Response':
+        """Issue a GitHub API request over the pooled client"""
+        response = await self._client.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self._client.aclose()
 
 class NotionIntelligenceHub:
     """Advanced Notion integration with AI orchestration"""
     
     def __init__(self, token: str):
         self.token = token
+        self.api_base = "https://api.notion.com/v1"
+        self._client = _http_client(self.api_base, {
+            'Authorization': f'Bearer {token}',
+            'Notion-Version': NOTION_API_VERSION
+        })
+        self.rate_limiter = RequestRateLimiter(NOTION_REQUESTS_PER_SECOND)
         self.databases = {}
         self.pages = {}
         self.automation_workflows = []
@@ -122,68 +481,18 @@ class NotionIntelligenceHub:
     async def create_case_management_workspace(self, case_context: Dict[str, Any]) -> str:
         """Create comprehensive case management workspace in Notion"""
         
+        case_name = case_context.get('case_name', 'Legal Matter')
+        
         # Create master database structure
         master_db_config = {
-            'name': f"Case Management: {case_context.get('case_name', 'Legal Matter')}",
-            'properties': {
-                'Evidence Item': {'type': 'title'},
-                'Document Type': {
-                    'type': 'select',
-                    'options': [
-                        'Court Filing', 'Email Evidence', 'Financial Record',
-                        'Medical Record', 'Communication Log', 'Photo Evidence',
-                        'Audio Recording', 'Video Evidence', 'Legal Research'
-                    ]
-                },
-                'Priority Level': {
-                    'type': 'select',
-                    'options': ['Critical', 'High', 'Medium', 'Low']
-                },
-                'Analysis Status': {
-                    'type': 'select',
-                    'options': ['Pending', 'In Progress', 'AI Analyzed', 'Human Reviewed', 'Complete']
-                },
-                'Legal Relevance Score': {'type': 'number'},
-                'Date Received': {'type': 'date'},
-                'Deadline': {'type': 'date'},
-                'Assigned To': {'type': 'people'},
-                'AI Analysis Summary': {'type': 'rich_text'},
-                'Strategic Value': {'type': 'number'},
-                'Compliance Status': {
-                    'type': 'select',
-                    'options': ['Compliant', 'Needs Review', 'Non-Compliant', 'Pending']
-                },
-                'Tags': {'type': 'multi_select'}
-            }
+            'name': f"Case Management: {case_name}",
+            'properties': _CASE_MANAGEMENT_PROPERTIES
         }
         
         # Create timeline database
         timeline_db_config = {
-            'name': f"Timeline: {case_context.get('case_name', 'Legal Matter')}",
-            'properties': {
-                'Event': {'type': 'title'},
-                'Date': {'type': 'date'},
-                'Event Type': {
-                    'type': 'select',
-                    'options': [
-                        'Court Hearing', 'Filing Deadline', 'Discovery Event',
-                        'Communication', 'Evidence Collection', 'Legal Research',
-                        'Strategic Decision', 'Compliance Check'
-                    ]
-                },
-                'Impact Level': {
-                    'type': 'select', 
-                    'options': ['Critical', 'High', 'Medium', 'Low']
-                },
-                'Status': {
-                    'type': 'select',
-                    'options': ['Upcoming', 'In Progress', 'Completed', 'Missed']
-                },
-                'Related Evidence': {'type': 'relation'},
-                'AI Analysis': {'type': 'rich_text'},
-                'Action Items': {'type': 'rich_text'},
-                'Responsible Party': {'type': 'people'}
-            }
+            'name': f"Timeline: {case_name}",
+            'properties': _TIMELINE_PROPERTIES
         }
         
         return await self.create_workspace_structure(master_db_config, timeline_db_config)
@@ -223,6 +532,17 @@ class NotionIntelligenceHub:
         workflows.append(deadline_workflow)
         
         return workflows
+    
+    async def request(self, method: str, path: str, **kwargs: Any) -> 'httpx.Response':
+        """Issue a Notion API request over the pooled client, within rate limits"""
+        async with self.rate_limiter:
+            response = await self._client.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self._client.aclose()
 
 class AIConstellationManager:
     """Manages multiple AI systems for maximum intelligence"""
@@ -236,35 +556,43 @@ class AIConstellationManager:
         }
         self.consensus_engine = ConsensusEngine()
         self.intelligence_cache = IntelligenceCache()
+        self.request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AI_REQUESTS)
     
     async def analyze_project_requirements(self, project_context: Dict[str, Any]) -> Dict[str, Any]:
         """Multi-AI analysis of project requirements for optimization"""
         
-        # Parallel analysis across AI providers
-        analysis_tasks = []
+        # Identical contexts produce identical strategies; skip the AI round trip
+        # Contexts without a canonical encoding are simply not cached
+        context_key = _content_digest(project_context)
+        if context_key is not None:
+            cached_strategy = await self.intelligence_cache.get_analysis(context_key)
+            if cached_strategy is not None:
+                return cached_strategy
+        
+        # Parallel analysis across AI providers; each call is (method, *args)
+        # so it is only started once it holds a request slot
+        analysis_calls = []
         
         if self.ai_providers['openai']:
-            analysis_tasks.append(
-                self.ai_providers['openai'].analyze_project_context(project_context)
+            analysis_calls.append(
+                (self.ai_providers['openai'].analyze_project_context, project_context)
             )
         
         if self.ai_providers['anthropic']:
-            analysis_tasks.append(
-                self.ai_providers['anthropic'].analyze_project_requirements(project_context)
+            analysis_calls.append(
+                (self.ai_providers['anthropic'].analyze_project_requirements, project_context)
             )
         
         if self.ai_providers['local_llm']:
-            analysis_tasks.append(
-                self.ai_providers['local_llm'].analyze_optimization_opportunities(project_context)
+            analysis_calls.append(
+                (self.ai_providers['local_llm'].analyze_optimization_opportunities, project_context)
             )
         
-        # Gather all analyses
-        analyses = await asyncio.gather(*analysis_tasks, return_exceptions=True)
+        # Collect analyses as they arrive, stopping once consensus is possible
+        analyses = await self.collect_analyses(analysis_calls)
         
         # Generate consensus optimization strategy
-        consensus_analysis = self.consensus_engine.generate_consensus(
-            [a for a in analyses if not isinstance(a, Exception)]
-        )
+        consensus_analysis = self.consensus_engine.generate_consensus(analyses)
         
         optimization_strategy = {
             'consensus_requirements': consensus_analysis.agreed_requirements,
@@ -278,11 +606,46 @@ class AIConstellationManager:
         }
         
         # Cache for future use
-        await self.intelligence_cache.store_analysis(
-            project_context.get('project_id'), optimization_strategy
-        )
+        if context_key is not None:
+            await self.intelligence_cache.store_analysis(context_key, optimization_strategy)
         
         return optimization_strategy
+    
+    async def collect_analyses(
+        self, analysis_calls: Sequence[Tuple[Callable[..., Awaitable[Dict[str, Any]]], ...]]
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Run provider analyses with bounded concurrency, in completion order
+        
+        Each call is a ``(method, *args)`` tuple; its coroutine is only created
+        once a request slot is free, so calls cancelled while still queued
+        never leave an un-awaited coroutine behind. Failed providers are
+        dropped as they complete, so the result holds only successful
+        analyses. Outstanding calls are cancelled as soon as the consensus
+        engine has enough analyses to decide, or when the overall timeout
+        expires.
+        """
+        
+        async def bounded(func, *args):
+            async with self.request_semaphore:
+                return await func(*args)
+        
+        pending = [asyncio.ensure_future(bounded(*call)) for call in analysis_calls]
+        analyses = []
+        
+        try:
+            for next_analysis in asyncio.as_completed(pending, timeout=AI_ANALYSIS_TIMEOUT_SECONDS):
+                try:
+                    analyses.append(await next_analysis)
+                except Exception:
+                    continue
+                
+                if self.consensus_engine.can_decide(analyses):
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        return tuple(analyses)
 
 class HyperDeploymentEngine:
     """Maximum velocity deployment with intelligent optimization"""
@@ -337,7 +700,7 @@ class HyperDeploymentEngine:
             return False
             
         except Exception as e:
-            logger.error(f"❌ Deployment failed: {e}")
+            logger.error("❌ Deployment failed: %s", e)
             return False
 
 class DynamicScaffoldGenerator:
@@ -372,100 +735,25 @@ class DynamicScaffoldGenerator:
     async def generate_mcp_server(self, spec: Dict[str, Any]) -> str:
         """Generate custom MCP server code"""
         
-        server_code = f"""
-#!/usr/bin/env python3
-"""
-{spec.get('name', 'Custom MCP Server')}
-Generated: {datetime.utcnow().isoformat()}
-Purpose: {spec.get('purpose', 'Custom functionality')}
-"""
-
-import asyncio
-from mcp.server.models import InitializationOptions
-from mcp.server import NotificationOptions, Server
-from mcp.types import Resource, Tool, TextContent, ImageContent, EmbeddedResource
-from typing import Any, Sequence
-
-server = Server("{spec.get('name', 'custom_server')}")
-
-@server.list_resources()
-async def handle_list_resources() -> list[Resource]:
-    """List available resources"""
-    return [
-        Resource(
-            uri="{spec.get('resource_uri', 'custom://resource')}",
-            name="{spec.get('resource_name', 'Custom Resource')}",
-            description="{spec.get('resource_description', 'Custom resource description')}",
-            mimeType="application/json"
-        )
-    ]
-
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools"""
-    return [
-        Tool(
-            name="{spec.get('tool_name', 'custom_tool')}",
-            description="{spec.get('tool_description', 'Custom tool functionality')}",
-            inputSchema={{
-                "type": "object",
-                "properties": {spec.get('tool_properties', {{}})},
-                "required": {spec.get('required_properties', [])}
-            }}
-        )
-    ]
-
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool execution with enhanced intelligence"""
-    
-    if name == "{spec.get('tool_name', 'custom_tool')}":
-        # Enhanced tool execution logic
-        result = await execute_intelligent_tool_logic(arguments)
+        # Resolve the async custom logic before rendering; it cannot be awaited
+        # from inside the template
+        custom_logic = await self.generate_custom_tool_logic(spec)
         
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )
-        ]
-    else:
-        raise ValueError(f"Unknown tool: {{name}}")
-
-async def execute_intelligent_tool_logic(arguments: dict) -> dict:
-    """Execute custom tool logic with AI enhancement"""
-    
-    # Custom logic based on specification
-    {await self.generate_custom_tool_logic(spec)}
-    
-    return {{
-        'status': 'success',
-        'result': 'Custom tool execution completed',
-        'timestamp': datetime.utcnow().isoformat(),
-        'intelligence_applied': True
-    }}
-
-async def main():
-    # Import server implementation
-    from mcp.server.stdio import stdio_server
-    
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="{spec.get('name', 'custom_server')}",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(NotificationOptions(), {{}}, {}}
-            )
+        return _MCP_SERVER_TEMPLATE.substitute(
+            title=_docstring_text(spec.get('name', 'Custom MCP Server')),
+            generated_at=_iso_now(),
+            purpose=_docstring_text(spec.get('purpose', 'Custom functionality')),
+            server_name=repr(spec.get('name', 'custom_server')),
+            resource_uri=repr(spec.get('resource_uri', 'custom://resource')),
+            resource_name=repr(spec.get('resource_name', 'Custom Resource')),
+            resource_description=repr(spec.get('resource_description', 'Custom resource description')),
+            tool_name=repr(spec.get('tool_name', 'custom_tool')),
+            tool_description=repr(spec.get('tool_description', 'Custom tool functionality')),
+            tool_properties=repr(spec.get('tool_properties', {})),
+            required_properties=repr(spec.get('required_properties', [])),
+            custom_logic=textwrap.indent(custom_logic, '    ')
         )
 
-if __name__ == '__main__':
-    asyncio.run(main())
-"""
-        
-        return server_code
-
 class EnhancedProvenanceSystem:
     """Advanced provenance tracking with blockchain integration"""
     
@@ -475,47 +763,77 @@ class EnhancedProvenanceSystem:
         self.responsibility_tracker = ResponsibilityTracker()
         self.timeline_manager = TimelineManager()
         self.audit_logger = EnhancedAuditLogger()
+        self._write_queue = asyncio.Queue(maxsize=PROVENANCE_QUEUE_MAX_RECORDS)
+        self._flusher_task = None
     
     async def track_artifact_provenance(self, artifact: Any, action_context: Dict[str, Any]) -> Dict[str, Any]:
         """Track comprehensive artifact provenance with enhanced intelligence"""
         
+        recorded_at = _iso_now()
+        
+        # The sub-analyses are independent of one another, so run them
+        # concurrently instead of paying each one's latency in turn
+        (
+            artifact_id,
+            origin,
+            responsible_party,
+            system_state,
+            intelligence_context,
+            (blockchain_hash, blockchain_payload),
+            parent_artifacts,
+            dependencies,
+            impact_analysis,
+            compliance_status,
+            security_classification,
+            system_version,
+            environment,
+            ai_involvement
+        ) = await asyncio.gather(
+            _run_cpu_bound(_artifact_id, artifact),
+            self.determine_origin(artifact),
+            self.responsibility_tracker.determine_responsibility(artifact, action_context),
+            self.capture_system_state(),
+            self.intelligence_analyzer.analyze_context(artifact, action_context),
+            self.blockchain_client.create_immutable_record(artifact),
+            self.identify_parent_artifacts(artifact),
+            self.analyze_dependencies(artifact),
+            self.analyze_impact(artifact, action_context),
+            self.check_compliance_status(artifact),
+            self.classify_security_level(artifact),
+            self.get_system_version(),
+            self.get_environment_info(),
+            self.analyze_ai_involvement(artifact, action_context)
+        )
+        
         provenance_record = {
-            'artifact_id': getattr(artifact, 'id', str(hash(str(artifact)))),
+            'artifact_id': artifact_id,
             'artifact_type': type(artifact).__name__,
-            'origin': await self.determine_origin(artifact),
-            'timestamp': datetime.utcnow().isoformat(),
+            'origin': origin,
+            'timestamp': recorded_at,
             'user_action': action_context.get('action', 'unknown'),
             'user_id': action_context.get('user_id', 'system'),
-            'responsible_party': await self.responsibility_tracker.determine_responsibility(
-                artifact, action_context
-            ),
-            'system_state': await self.capture_system_state(),
-            'intelligence_context': await self.intelligence_analyzer.analyze_context(
-                artifact, action_context
-            ),
-            'blockchain_hash': await self.blockchain_client.create_immutable_record(artifact),
-            'parent_artifacts': await self.identify_parent_artifacts(artifact),
-            'dependencies': await self.analyze_dependencies(artifact),
-            'impact_analysis': await self.analyze_impact(artifact, action_context),
-            'compliance_status': await self.check_compliance_status(artifact),
-            'security_classification': await self.classify_security_level(artifact),
+            'responsible_party': responsible_party,
+            'system_state': system_state,
+            'intelligence_context': intelligence_context,
+            'blockchain_hash': blockchain_hash,
+            'parent_artifacts': parent_artifacts,
+            'dependencies': dependencies,
+            'impact_analysis': impact_analysis,
+            'compliance_status': compliance_status,
+            'security_classification': security_classification,
             'metadata': {
                 'creation_context': action_context,
-                'system_version': await self.get_system_version(),
-                'environment': await self.get_environment_info(),
-                'ai_involvement': await self.analyze_ai_involvement(artifact, action_context)
+                'system_version': system_version,
+                'environment': environment,
+                'ai_involvement': ai_involvement
             }
         }
         
-        # Store in multiple systems for redundancy and verification
-        storage_tasks = [
-            self.blockchain_client.store_record(provenance_record),
-            self.database_client.store_record(provenance_record),
-            self.timeline_manager.add_timeline_event(provenance_record),
-            self.audit_logger.log_provenance_event(provenance_record)
-        ]
-        
-        await asyncio.gather(*storage_tasks, return_exceptions=True)
+        # Store in multiple systems for redundancy and verification; the
+        # background writer batches records across artifacts. The copy keeps
+        # the stored record free of the insights added below, and carries the
+        # encoded payload to be anchored with it.
+        await self.enqueue_for_storage(dict(provenance_record, blockchain_payload=blockchain_payload))
         
         # Generate intelligence insights
         insights = await self.intelligence_analyzer.generate_provenance_insights(provenance_record)
@@ -523,6 +841,75 @@ class EnhancedProvenanceSystem:
         
         return provenance_record
     
+    async def enqueue_for_storage(self, provenance_record: Dict[str, Any]) -> None:
+        """Queue a record for batched storage, waiting if the queue is full"""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_queued_records())
+        await self._write_queue.put(provenance_record)
+    
+    async def store_records_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Store a batch of records in every backing system"""
+        results = await asyncio.gather(
+            self.blockchain_client.store_records_batch(records),
+            self.database_client.store_records_batch(records),
+            self.timeline_manager.add_timeline_events(records),
+            self.audit_logger.log_provenance_events(records),
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("❌ Provenance batch storage failed: %s", result)
+    
+    async def flush(self) -> None:
+        """Wait until every queued record has been written"""
+        if self._flusher_task is not None:
+            await self._write_queue.join()
+    
+    async def aclose(self) -> None:
+        """Flush queued records and stop the background writer"""
+        if self._flusher_task is None:
+            return
+        
+        await self.flush()
+        self._flusher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._flusher_task
+        self._flusher_task = None
+    
+    async def _flush_queued_records(self) -> None:
+        """Background writer: drain the queue in batches until cancelled"""
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.store_records_batch(batch)
+            except Exception as e:
+                logger.error("❌ Provenance batch storage failed: %s", e)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Wait for a record, then gather more until the batch is full or the interval ends"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._write_queue.get()]
+        deadline = loop.time() + PROVENANCE_FLUSH_INTERVAL_SECONDS
+        
+        while len(batch) < PROVENANCE_BATCH_SIZE:
+            if not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+                continue
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._write_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
     async def generate_enhanced_audit_report(self, project_id: str, time_range: Dict[str, str]) -> Dict[str, Any]:
         """Generate comprehensive audit report with intelligence analysis"""
         
@@ -534,18 +921,20 @@ class EnhancedProvenanceSystem:
             provenance_data
         )
         
+        summary = _summarize_provenance(provenance_data)
+        
         # Create comprehensive audit report
         audit_report = {
             'report_id': f"audit_{project_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
             'project_id': project_id,
             'time_range': time_range,
-            'generation_timestamp': datetime.utcnow().isoformat(),
+            'generation_timestamp': _iso_now(),
             
             'summary_statistics': {
                 'total_artifacts': len(provenance_data),
-                'unique_users': len(set(r['user_id'] for r in provenance_data)),
-                'action_types': await self.analyze_action_distribution(provenance_data),
-                'compliance_score': await self.calculate_compliance_score(provenance_data),
+                'unique_users': summary['unique_users'],
+                'action_types': summary['action_types'],
+                'compliance_score': summary['compliance_score'],
                 'security_incidents': await self.identify_security_incidents(provenance_data)
             },
             
@@ -580,16 +969,39 @@ class EnhancedProvenanceSystem:
         return audit_report
 
 class HyperIntelligentOrchestrator:
-    """Maximum velocity development orchestration system"""
+    """Maximum velocity development orchestration system
     
-    def __init__(self):
-        self.github_connector = GitHubEnhancedConnector()
-        self.notion_orchestrator = NotionIntelligenceHub()
-        self.ai_constellation = AIConstellationManager()
-        self.deployment_engine = HyperDeploymentEngine()
-        self.scaffold_generator = DynamicScaffoldGenerator()
-        self.provenance_tracker = EnhancedProvenanceSystem()
-        self.intelligence_monitor = ContinuousIntelligenceMonitor()
+    Subsystems are built on first access, so callers that only need one of
+    them do not pay for constructing the rest.
+    """
+    
+    @cached_property
+    def github_connector(self) -> GitHubEnhancedConnector:
+        return GitHubEnhancedConnector(os.environ['GITHUB_TOKEN'])
+    
+    @cached_property
+    def notion_orchestrator(self) -> NotionIntelligenceHub:
+        return NotionIntelligenceHub(os.environ['NOTION_TOKEN'])
+    
+    @cached_property
+    def ai_constellation(self) -> AIConstellationManager:
+        return AIConstellationManager()
+    
+    @cached_property
+    def deployment_engine(self) -> HyperDeploymentEngine:
+        return HyperDeploymentEngine()
+    
+    @cached_property
+    def scaffold_generator(self) -> DynamicScaffoldGenerator:
+        return DynamicScaffoldGenerator()
+    
+    @cached_property
+    def provenance_tracker(self) -> EnhancedProvenanceSystem:
+        return EnhancedProvenanceSystem()
+    
+    @cached_property
+    def intelligence_monitor(self) -> 'ContinuousIntelligenceMonitor':
+        return ContinuousIntelligenceMonitor()
     
     async def initiate_maximum_velocity_mode(self, project_context: Dict[str, Any]) -> Dict[str, Any]:
         """Activate hyper-intelligent development acceleration"""
@@ -634,7 +1046,7 @@ class HyperIntelligentOrchestrator:
             'monitoring': True,
             'optimization_strategy': optimization_strategy,
             'provenance_record': orchestration_record,
-            'activation_timestamp': datetime.utcnow().isoformat(),
+            'activation_timestamp': _iso_now(),
             'performance_metrics': await self.get_initial_performance_baseline(),
             'intelligence_level': 'MAXIMUM',
             'velocity_mode': 'HYPER'
@@ -707,29 +1119,120 @@ class HyperIntelligentOrchestrator:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to activate continuous intelligence: {e}")
+            logger.error("❌ Failed to activate continuous intelligence: %s", e)
             return False
+    
+    async def shutdown(self) -> None:
+        """Flush pending provenance writes and release pooled API connections"""
+        # Only close subsystems that were actually built
+        subsystems = [
+            self.__dict__[name]
+            for name in ('github_connector', 'notion_orchestrator', 'provenance_tracker')
+            if name in self.__dict__
+        ]
+        await asyncio.gather(*(subsystem.aclose() for subsystem in subsystems))
 
 # Support classes and utilities
 class ConsensusEngine:
     """Generate consensus from multiple AI analyses"""
     
-    def generate_consensus(self, analyses: List[Dict[str, Any]]) -> Any:
+    def __init__(self, quorum: int = 2):
+        self.quorum = quorum
+    
+    def can_decide(self, analyses: Sequence[Dict[str, Any]]) -> bool:
+        """Whether enough analyses have arrived to reach consensus"""
+        return len(analyses) >= self.quorum
+    
+    def generate_consensus(self, analyses: Sequence[Dict[str, Any]]) -> Any:
         # Consensus generation logic
         pass
 
 class IntelligenceCache:
     """Intelligent caching system for analysis results"""
     
-    async def store_analysis(self, project_id: str, analysis: Dict[str, Any]) -> bool:
-        # Cache storage logic
-        pass
+    def __init__(self, maxsize: int = ANALYSIS_CACHE_MAX_ENTRIES,
+                 ttl: float = ANALYSIS_CACHE_TTL_SECONDS):
+        self._analyses = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    async def get_analysis(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a private copy of a cached analysis, or None if it is missing or expired"""
+        analysis = self._analyses.get(cache_key)
+        return copy.deepcopy(analysis) if analysis is not None else None
+    
+    async def store_analysis(self, cache_key: str, analysis: Dict[str, Any]) -> bool:
+        """Cache a snapshot of an analysis until its TTL expires"""
+        self._analyses[cache_key] = copy.deepcopy(analysis)
+        return True
+
+class RequestRateLimiter:
+    """Spaces requests evenly so no more than max_rate start per period"""
+    
+    def __init__(self, max_rate: float, period: float = 1.0):
+        self.interval = period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
 
 class BlockchainProvenanceClient:
     """Blockchain-based provenance tracking"""
     
-    async def create_immutable_record(self, artifact: Any) -> str:
+    @staticmethod
+    def record_hash(artifact: Any) -> str:
+        """Immutable record hash over the artifact's canonical, uncompressed encoding.
+
+        Artifacts without a canonical encoding are hashed over a random nonce:
+        the record stays unique but cannot be re-derived from the artifact.
+        """
+        try:
+            canonical = _canonical_encoding(artifact)
+        except (TypeError, RecursionError):
+            canonical = uuid.uuid4().bytes
+        return hashlib.blake2b(canonical, digest_size=32).hexdigest()
+    
+    @staticmethod
+    def encode_payload(artifact: Any) -> bytes:
+        """Compact transport payload: zstd-compressed MessagePack.
+
+        Artifacts MessagePack cannot walk (cycles, excessive nesting) are
+        packed as their string form.
+        """
+        try:
+            packed = msgpack.packb(artifact, default=str, use_bin_type=True)
+        except (TypeError, ValueError, RecursionError):
+            packed = msgpack.packb(str(artifact), use_bin_type=True)
+        return zstandard.compress(packed, PAYLOAD_COMPRESSION_LEVEL)
+    
+    @staticmethod
+    def decode_payload(payload: bytes) -> Any:
+        """Inverse of encode_payload"""
+        return msgpack.unpackb(zstandard.decompress(payload), raw=False, strict_map_key=False)
+    
+    @classmethod
+    def _hash_and_encode(cls, artifact: Any) -> Tuple[str, bytes]:
+        return cls.record_hash(artifact), cls.encode_payload(artifact)
+    
+    async def create_immutable_record(self, artifact: Any) -> Tuple[str, bytes]:
+        """Record hash and encoded payload; the payload travels with the stored record"""
         # Blockchain record creation logic
+        return await _run_cpu_bound(self._hash_and_encode, artifact)
+    
+    async def store_records_batch(self, records: List[Dict[str, Any]]) -> bool:
+        payloads = {
+            record['blockchain_hash']: record['blockchain_payload']
+            for record in records
+            if record.get('blockchain_payload') is not None
+        }
+        # Batched on-chain anchoring logic
         pass
 
 class ContinuousIntelligenceMonitor:
@@ -768,16 +1271,24 @@ async def main():
     }
     
     # Activate maximum velocity mode
-    hyper_velocity_env = await orchestrator.initiate_maximum_velocity_mode(project_context)
+    try:
+        hyper_velocity_env = await orchestrator.initiate_maximum_velocity_mode(project_context)
+    finally:
+        await orchestrator.shutdown()
     
     logger.info("🎉 Hyper-Intelligent Orchestration Complete!")
-    logger.info(f"✅ Status: {hyper_velocity_env['status']}")
-    logger.info(f"🔧 Tools Generated: {len(hyper_velocity_env['tools'])}")
-    logger.info(f"📊 Monitoring: {hyper_velocity_env['monitoring']}")
+    logger.info("✅ Status: %s", hyper_velocity_env['status'])
+    logger.info("🔧 Tools Generated: %d", len(hyper_velocity_env['tools']))
+    logger.info("📊 Monitoring: %s", hyper_velocity_env['monitoring'])
     
     return hyper_velocity_env
 
 if __name__ == '__main__':
     # Run the hyper-intelligent orchestrator
     result = asyncio.run(main())
-    print(json.dumps(result, indent=2, default=str))
\ No newline at end of file
+    sys.stdout.buffer.write(orjson.dumps(
+        result,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ))
+    sys.stdout.buffer.write(b'\n')
\ No newline at end of file
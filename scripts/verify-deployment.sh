@@ -123,6 +123,36 @@ else
     log_error "Dynamic tool forge has syntax errors"
 fi'
 
+run_check '
+if python3 -m py_compile tools/generated/*.py 2>/dev/null; then
+    log_success "Generated tool modules syntax is valid"
+else
+    log_error "Generated tool modules have syntax errors"
+fi'
+
+run_check '
+if ! python3 -c "import pandas, networkx, sklearn" 2>/dev/null; then
+    log_warning "Timeline normalization check skipped (pandas, networkx or scikit-learn missing)"
+elif python3 - 2>/dev/null <<EOF
+import asyncio
+from tools.generated.timeline_reconstructor import TimelineReconstructor
+
+# ISO strings, epoch seconds, free-form dates and junk in one batch
+events = [{"timestamp": value} for value in (
+    "2024-01-15T10:30:00Z", "2024-02-20", 1705314600, 1705314600.5,
+    "January 5, 2024", "9999-12-31", "not a date", None, 10 ** 20
+)]
+normalized = asyncio.run(TimelineReconstructor({"case_id": "verify"}).normalize_timestamps(events))
+assert [event["timestamp"][:10] for event in normalized] == [
+    "2024-01-05", "2024-01-15", "2024-01-15", "2024-01-15", "2024-02-20", "9999-12-31"
+], normalized
+EOF
+then
+    log_success "Timeline normalization handles mixed timestamp inputs"
+else
+    log_error "Timeline normalization failed on mixed timestamp inputs"
+fi'
+
 # File Size Verification
 log_info "Verifying file completeness..."
 
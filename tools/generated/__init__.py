@@ -0,0 +1,28 @@
+"""
+🔧 FILEBOSS Generated Tool Modules
+
+Case tools produced by the Dynamic Tool Forge share the modules in this
+package; each generated tool is only a small per-case manifest naming the
+module to run and the case it is configured for.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+# Environment variable pointing at a manifest file when a tool module is run
+# directly instead of through a forge-generated launcher
+MANIFEST_PATH_ENV = 'FILEBOSS_TOOL_MANIFEST'
+
+def load_manifest(path: Optional[str] = None) -> Dict[str, Any]:
+    """Load a tool manifest from a JSON file, or from CASE_* environment variables"""
+    path = path or os.environ.get(MANIFEST_PATH_ENV)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    return {
+        'case_id': os.environ.get('CASE_ID', 'Unknown'),
+        'case_type': os.environ.get('CASE_TYPE', 'general'),
+        'jurisdiction': os.environ.get('JURISDICTION', 'unknown')
+    }
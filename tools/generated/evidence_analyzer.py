@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Evidence Analyzer Tool
+Case-specific legal evidence analysis, configured by a forge tool manifest
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Any, Optional
+import hashlib
+from datetime import datetime
+import sys
+from pathlib import Path
+
+if not __package__:
+    # Run as a script: make the repository root importable so the
+    # tools.generated package resolves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.generated import load_manifest
+
+class EvidenceAnalyzer:
+    def __init__(self, manifest: Dict[str, Any]):
+        self.case_id = manifest['case_id']
+        self.case_type = manifest['case_type']
+        self.jurisdiction = manifest['jurisdiction']
+        self.ai_models = AIModelManager()
+        self.blockchain_tracker = BlockchainTracker()
+    
+    async def analyze_evidence_item(self, evidence_path: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Comprehensive analysis of evidence item"""
+        
+        # Determine evidence type
+        evidence_type = await self.detect_evidence_type(evidence_path)
+        
+        analysis_result = {
+            'evidence_id': hashlib.blake2b(evidence_path.encode(), digest_size=8).hexdigest(),
+            'case_id': self.case_id,
+            'file_path': evidence_path,
+            'evidence_type': evidence_type,
+            'analysis_timestamp': datetime.utcnow().isoformat(),
+            'metadata': metadata,
+            'integrity_hash': await self.calculate_integrity_hash(evidence_path),
+            'chain_of_custody': await self.blockchain_tracker.create_custody_record(evidence_path)
+        }
+        
+        # Specialized analysis based on evidence type
+        if evidence_type == 'document':
+            analysis_result.update(await self.analyze_document(evidence_path))
+        elif evidence_type == 'image':
+            analysis_result.update(await self.analyze_image(evidence_path))
+        elif evidence_type == 'audio':
+            analysis_result.update(await self.analyze_audio(evidence_path))
+        elif evidence_type == 'video':
+            analysis_result.update(await self.analyze_video(evidence_path))
+        elif evidence_type == 'email':
+            analysis_result.update(await self.analyze_email(evidence_path))
+        
+        # AI-powered legal analysis
+        legal_analysis = await self.ai_models.analyze_legal_relevance(
+            analysis_result, self.case_type, self.jurisdiction
+        )
+        analysis_result['legal_analysis'] = legal_analysis
+        
+        # Generate strategic insights
+        strategic_insights = await self.generate_strategic_insights(analysis_result)
+        analysis_result['strategic_insights'] = strategic_insights
+        
+        return analysis_result
+    
+    async def analyze_document(self, file_path: str) -> Dict[str, Any]:
+        """Specialized document analysis"""
+        
+        # OCR and text extraction
+        extracted_text = await self.extract_text_content(file_path)
+        
+        # Legal entity recognition
+        entities = await self.ai_models.extract_legal_entities(extracted_text)
+        
+        # Key date extraction
+        dates = await self.extract_key_dates(extracted_text)
+        
+        # Legal precedent matching
+        precedents = await self.ai_models.find_relevant_precedents(extracted_text, self.jurisdiction)
+        
+        return {
+            'document_analysis': {
+                'text_content': extracted_text,
+                'legal_entities': entities,
+                'key_dates': dates,
+                'relevant_precedents': precedents,
+                'compliance_flags': await self.check_compliance_issues(extracted_text),
+                'confidentiality_level': await self.assess_confidentiality(extracted_text)
+            }
+        }
+    
+    async def generate_strategic_insights(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate strategic legal insights from analysis"""
+        
+        insights = await self.ai_models.generate_strategic_analysis(
+            analysis_result, 
+            case_context={
+                'case_id': self.case_id,
+                'case_type': self.case_type,
+                'jurisdiction': self.jurisdiction
+            }
+        )
+        
+        return {
+            'strategic_value': insights.get('strategic_value', 0),
+            'legal_strength': insights.get('legal_strength', 0),
+            'risk_assessment': insights.get('risk_assessment', 'unknown'),
+            'recommended_actions': insights.get('recommended_actions', []),
+            'timeline_impact': insights.get('timeline_impact', 'neutral'),
+            'case_theory_support': insights.get('case_theory_support', 'unknown')
+        }
+
+# Support classes
+class AIModelManager:
+    """AI model access for legal analysis"""
+    
+    async def analyze_legal_relevance(self, analysis_result: Dict[str, Any], case_type: str,
+                                      jurisdiction: str) -> Dict[str, Any]:
+        # Legal relevance analysis logic
+        return {}
+    
+    async def extract_legal_entities(self, text: str) -> List[Dict[str, Any]]:
+        # Legal entity extraction logic
+        return []
+    
+    async def find_relevant_precedents(self, text: str, jurisdiction: str) -> List[Dict[str, Any]]:
+        # Precedent matching logic
+        return []
+    
+    async def generate_strategic_analysis(self, analysis_result: Dict[str, Any],
+                                          case_context: Dict[str, Any]) -> Dict[str, Any]:
+        # Strategic analysis logic
+        return {}
+
+class BlockchainTracker:
+    """Chain-of-custody tracking for evidence"""
+    
+    async def create_custody_record(self, evidence_path: str) -> Dict[str, Any]:
+        # Custody record creation logic
+        return {}
+
+# Tool execution interface
+async def main(manifest: Optional[Dict[str, Any]] = None):
+    analyzer = EvidenceAnalyzer(manifest or load_manifest())
+    
+    # Example usage
+    evidence_files = [
+        '/app/evidence/court_order.pdf',
+        '/app/evidence/communication_log.txt',
+        '/app/evidence/financial_records.xlsx'
+    ]
+    
+    for evidence_file in evidence_files:
+        try:
+            result = await analyzer.analyze_evidence_item(
+                evidence_file,
+                {'source': 'court_filing', 'priority': 'high'}
+            )
+            print(f"Analysis completed for {evidence_file}")
+            print(json.dumps(result, indent=2))
+        except Exception as e:
+            print(f"Error analyzing {evidence_file}: {e}")
+
+if __name__ == '__main__':
+    asyncio.run(main())